@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.data.fetch_data import get_historical_data
+from src.data.fetch_data import get_cached_ticker_data
 from src.simulations.monte_carlo import monte_carlo_with_metrics
 from src.visualizations.plot_monte_carlo_with_metrics import plot_monte_carlo_with_metrics
 from src.calculations.metrics import calculate_sharpe_ratio, calculate_max_drawdown, calculate_var, calculate_cvar, calculate_omega_ratio
@@ -63,7 +63,7 @@ class PortfolioGUI:
             start_date = self.start_date_entry.get()
             end_date = self.end_date_entry.get()
 
-            data = get_historical_data(ticker, start_date, end_date)
+            data = get_cached_ticker_data(ticker, start_date, end_date)
             self.output_text.delete(1.0, tk.END)
             self.output_text.insert(tk.END, f"Fetched Data ({start_date} to {end_date}):\n{data}\n")
         except Exception as e:
@@ -8,7 +8,9 @@ This module contains core financial calculations for portfolio optimization.
 
 2. calculate_covariance:
    - Calculates the covariance matrix of asset returns.
-   - Input: A DataFrame of asset returns.
+   - Inputs:
+       - returns: A DataFrame of asset returns.
+       - method: "centered" (default) or "posthoc" (X'X - T*mu*mu', no centered copy).
    - Output: Covariance matrix as a DataFrame.
 
 3. portfolio_performance:
@@ -18,13 +20,16 @@ This module contains core financial calculations for portfolio optimization.
        - mean_returns: Series of average asset returns.
        - cov_matrix: Covariance matrix of returns.
    - Output: A tuple (expected return, risk).
+   - portfolio_performance_batch evaluates a 2-D array of weights (one portfolio per row)
+     and returns arrays of returns and risks.
 
 4. calculate_sharpe_ratio:
    - Computes the Sharpe Ratio for a portfolio.
-   - Inputs:
+   - Inputs, either:
+       - returns: Series of portfolio returns, risk_free_rate: Default 0.01 (sharpe_from_returns), or
        - portfolio_return: Expected portfolio return.
        - portfolio_volatility: Portfolio risk (volatility).
-       - risk_free_rate: Default 0.02 (2%).
+       - risk_free_rate: Default 0.02 (2%) (sharpe_from_stats).
    - Output: Sharpe Ratio.
 
 5. calculate_omega_ratio:
@@ -32,6 +37,7 @@ This module contains core financial calculations for portfolio optimization.
    - Inputs:
        - returns: DataFrame of portfolio returns.
        - threshold: Threshold return (e.g., risk-free rate).
+       - axis: Axis holding the time dimension for 2-D input (default 0).
    - Output: Omega Ratio.
 
 6. calculate_var:
@@ -39,6 +45,7 @@ This module contains core financial calculations for portfolio optimization.
    - Inputs:
        - returns: Series of portfolio returns.
        - confidence_level: The confidence level for VaR calculation (e.g., 0.95).
+       - axis: Axis holding the time dimension for 2-D input (default 0).
    - Output: Value at Risk.
 
 7. calculate_cvar:
@@ -46,13 +53,15 @@ This module contains core financial calculations for portfolio optimization.
    - Inputs:
        - returns: Series of portfolio returns.
        - confidence_level: The confidence level for CVaR calculation.
+       - axis: Axis holding the time dimension for 2-D input (default 0).
+       - var: Optional precomputed VaR to reuse.
    - Output: Conditional Value at Risk.
 
 8. calculate_max_drawdown:
    - Computes the Maximum Drawdown of the portfolio.
    - Inputs:
-       - portfolio_values: Series of portfolio values over time.
-   - Output: Maximum Drawdown.
+       - portfolio_values: Series of portfolio values over time (or a 2-D array, one path per column).
+   - Output: Maximum Drawdown (one value per column for 2-D input).
 """
 
 import numpy as np
@@ -61,73 +70,161 @@ import pandas as pd
 # Existing functions (calculate_returns, calculate_covariance, portfolio_performance)
 
 def calculate_returns(prices):
-    returns = np.log(prices / prices.shift(1))
-    return returns.dropna()
+    log_prices = np.log(prices.to_numpy(dtype=np.float64))
+    log_returns = np.diff(log_prices, axis=0)
+    if prices.ndim == 1:
+        returns = pd.Series(log_returns, index=prices.index[1:], name=prices.name)
+    else:
+        returns = pd.DataFrame(log_returns, index=prices.index[1:], columns=prices.columns)
+
+    # Only rows around missing prices need dropping
+    if np.isnan(log_returns).any():
+        return returns.dropna()
+    return returns
+
+def calculate_covariance(returns, method="centered"):
+    """
+    Calculate the covariance matrix of asset returns.
 
-def calculate_covariance(returns):
-    return returns.cov()
+    Parameters:
+        returns: pd.DataFrame - Asset returns (rows are periods, columns are assets).
+        method: str - "centered" subtracts the mean and multiplies once (numerically safest),
+                "posthoc" uses (X'X - T * mu mu') / (T - 1) and avoids the centered copy of
+                the returns matrix; prefer it only when mean returns are small relative to volatility.
+
+    Returns:
+        Covariance matrix as a DataFrame. Returns containing NaNs fall back to pandas'
+        pairwise-complete estimate.
+    """
+    if method not in {"centered", "posthoc"}:
+        raise ValueError("Invalid method. Choose from: centered, posthoc.")
+
+    X = np.asarray(returns, dtype=np.float64)
+    if np.isnan(X).any():
+        return returns.cov()  # Pairwise-complete estimate when data has gaps
+
+    T = X.shape[0]
+    mu = X.mean(axis=0)
+    if method == "centered":
+        X_centered = X - mu
+        cov = (X_centered.T @ X_centered) / (T - 1)
+    else:
+        cov = (X.T @ X - T * np.outer(mu, mu)) / (T - 1)
+    return pd.DataFrame(cov, index=returns.columns, columns=returns.columns)
 
 def portfolio_performance(weights, mean_returns, cov_matrix):
-    weights = np.array(weights)
+    weights = np.asarray(weights, dtype=np.float64)
     portfolio_return = np.dot(weights, mean_returns)
-    portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
+    portfolio_volatility = np.sqrt(weights @ np.asarray(cov_matrix) @ weights)
     return portfolio_return, portfolio_volatility
 
-def calculate_sharpe_ratio(returns, risk_free_rate=0.01):
+def portfolio_performance_batch(weights, mean_returns, cov_matrix):
+    """
+    Evaluate the expected return and risk of many portfolios at once.
+
+    Parameters:
+        weights: 2-D array - One row of portfolio weights per portfolio.
+        mean_returns: Series or array of average asset returns.
+        cov_matrix: Covariance matrix of returns.
+
+    Returns:
+        Tuple of arrays (expected returns, risks), one entry per portfolio.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    portfolio_returns = weights @ mean_returns
+    # Row-wise quadratic forms w_p' S w_p: one BLAS matmul, then a row-wise dot product
+    portfolio_volatilities = np.sqrt(np.einsum('pi,pi->p', weights @ cov_matrix, weights))
+    return portfolio_returns, portfolio_volatilities
+
+def sharpe_from_returns(returns, risk_free_rate=0.01, axis=0):
+    """
+    Calculate the Sharpe Ratio from a series of portfolio returns.
+    For 2-D input, one Sharpe Ratio is returned per series along `axis`.
+    """
+    values = np.asarray(returns, dtype=np.float64)
+    excess_returns = np.nanmean(values, axis=axis) - risk_free_rate
+    volatility = np.nanstd(values, axis=axis, ddof=1)
+
+    # Zero volatility gives a Sharpe Ratio of 0
+    sharpe_ratio = np.divide(excess_returns, volatility, out=np.zeros(np.shape(excess_returns)),
+                             where=volatility != 0)
+    return sharpe_ratio[()]
+
+def sharpe_from_stats(portfolio_return, portfolio_volatility, risk_free_rate=0.02):
+    """
+    Calculate the Sharpe Ratio from a portfolio's expected return and volatility.
+    """
+    excess_return = portfolio_return - risk_free_rate
+    return excess_return / portfolio_volatility if portfolio_volatility != 0 else 0
+
+def calculate_sharpe_ratio(returns, *args, **kwargs):
     """
     Calculate the Sharpe Ratio for a portfolio.
+    A series of returns is handled by sharpe_from_returns; a scalar expected return
+    followed by its volatility is handled by sharpe_from_stats.
     """
-    excess_returns = returns.mean() - risk_free_rate
-    volatility = returns.std()
-    return excess_returns / volatility if volatility != 0 else 0
+    if np.ndim(returns) == 0:
+        return sharpe_from_stats(returns, *args, **kwargs)
+    return sharpe_from_returns(returns, *args, **kwargs)
 
-def calculate_omega_ratio(returns, threshold=0.0):
+def calculate_omega_ratio(returns, threshold=0.0, axis=0):
     """
     Calculate the Omega Ratio of the portfolio.
 
     Parameters:
-        returns: pd.Series - Asset returns.
+        returns: pd.Series or np.ndarray - Asset returns (2-D input gives one ratio per series along axis).
         threshold: float - Minimum acceptable return (default is 0%).
+        axis: int - Axis holding the time dimension for 2-D input (default 0).
 
     Returns:
-        Omega Ratio as a float.
+        Omega Ratio as a float (an array of ratios for 2-D input).
     """
-    excess_gains = returns[returns > threshold] - threshold
-    excess_losses = threshold - returns[returns <= threshold]
-
-    if excess_losses.sum() == 0:
-        return float('inf')  # If no losses, Omega Ratio is infinite.
+    excess = np.asarray(returns, dtype=np.float64) - threshold
+    excess_gains = np.nansum(np.clip(excess, 0, None), axis=axis)
+    excess_losses = np.nansum(np.clip(-excess, 0, None), axis=axis)
 
-    return excess_gains.sum() / excess_losses.sum()
+    # If no losses, Omega Ratio is infinite.
+    omega = np.divide(excess_gains, excess_losses, out=np.full(np.shape(excess_gains), np.inf),
+                      where=excess_losses != 0)
+    return omega[()]
 
 
-def calculate_var(returns, confidence_level=0.95):
+def calculate_var(returns, confidence_level=0.95, axis=0):
     """
     Calculate the Value at Risk (VaR) for the portfolio.
+    For 2-D input, one VaR is returned per series along `axis`.
     """
-    return np.percentile(returns, (1 - confidence_level) * 100)
+    return np.percentile(returns, (1 - confidence_level) * 100, axis=axis)
 
-def calculate_cvar(returns, confidence_level=0.95):
+def calculate_cvar(returns, confidence_level=0.95, axis=0, var=None):
     """
     Calculate the Conditional Value at Risk (CVaR) for the portfolio.
+    For 2-D input, one CVaR is returned per series along `axis`.
+    Pass `var` from calculate_var to avoid selecting the quantile twice.
     """
-    var = calculate_var(returns, confidence_level)
-    return returns[returns <= var].mean()
+    values = np.asarray(returns, dtype=np.float64)
+    if var is None:
+        var = calculate_var(values, confidence_level, axis=axis)
+    var = np.expand_dims(var, axis)
+    tail = values <= var
+    return np.sum(values, axis=axis, where=tail) / np.sum(tail, axis=axis)
 
 def calculate_max_drawdown(portfolio_values):
     """
     Calculate the Maximum Drawdown (MDD) for a portfolio.
 
     Parameters:
-        portfolio_values (array-like): Portfolio values over time.
+        portfolio_values (array-like): Portfolio values over time. A 2-D array is
+            treated as one path per column (e.g. Monte Carlo simulations).
 
     Returns:
-        float: Maximum Drawdown value.
+        float: Maximum Drawdown value (an array of per-column values for 2-D input).
     """
-    if isinstance(portfolio_values, np.ndarray):  # Handle NumPy arrays
-        portfolio_values = pd.Series(portfolio_values)
+    values = np.asarray(portfolio_values, dtype=np.float64)
 
-    cumulative_max = portfolio_values.cummax()
-    drawdown = (portfolio_values - cumulative_max) / cumulative_max
-    max_drawdown = drawdown.min()
-    return max_drawdown
\ No newline at end of file
+    # fmax ignores missing values, matching pandas' skipna behaviour
+    cumulative_max = np.fmax.accumulate(values, axis=0)
+    drawdown = (values - cumulative_max) / cumulative_max
+    return np.nanmin(drawdown, axis=0)
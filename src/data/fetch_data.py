@@ -15,14 +15,26 @@ Functions:
 5. get_historical_data_for_asset_class: Fetch historical data by asset class.
 6. get_realtime_data_for_asset_class: Fetch real-time data by asset class.
 7. get_cached_historical_data: Cached historical data retrieval for efficiency.
+8. get_cached_ticker_data: Cached historical data retrieval for a single symbol.
+9. extract_close_prices: Select the Close column of every ticker from multi-ticker data.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+import time
 from joblib import Memory
 import yfinance as yf
 
 # Setup cache directory for joblib caching
 memory = Memory("./data_cache", verbose=0)
 
+# Maximum number of concurrent requests when fetching several symbols
+MAX_WORKERS = 16
+
+# Length in seconds of the wall-clock windows within which a fetched real-time quote is reused
+QUOTE_TTL = 5
+
 def get_historical_data(ticker, start_date, end_date):
     """
     Fetch historical OHLCV data for a single symbol.
@@ -42,26 +54,28 @@ def get_realtime_data(ticker):
 
 def get_batch_historical_data(tickers, start_date, end_date):
     """
-    Fetch historical OHLCV data for multiple symbols.
+    Fetch historical OHLCV data for multiple symbols in a single multi-ticker request.
     """
-    return yf.download(tickers, start=start_date, end=end_date, group_by='ticker')
+    return yf.download(tickers, start=start_date, end=end_date, group_by='ticker', threads=True, progress=False)
+
+def _fetch_batch_quote(ticker):
+    """
+    Fetch the latest price for one symbol, reporting failures in the result.
+    """
+    try:
+        return get_realtime_data(ticker)
+    except Exception as e:
+        return {"error": str(e)}
 
 def get_batch_realtime_data(tickers):
     """
     Fetch the latest prices for multiple symbols.
+    Requests are issued concurrently since each one is network-bound.
     """
-    results = {}
-    for ticker in tickers:
-        try:
-            stock = yf.Ticker(ticker)
-            latest_data = stock.history(period="1d")
-            results[ticker] = {
-                "price": latest_data["Close"].iloc[-1],
-                "timestamp": latest_data.index[-1]
-            }
-        except Exception as e:
-            results[ticker] = {"error": str(e)}
-    return results
+    # Materialise the symbols: executor.map would otherwise exhaust a one-shot iterator before zip reads it
+    tickers = list(tickers)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(zip(tickers, executor.map(_fetch_batch_quote, tickers)))
 
 def get_historical_data_for_asset_class(asset_type, symbols, start_date, end_date):
     """
@@ -80,34 +94,60 @@ def get_historical_data_for_asset_class(asset_type, symbols, start_date, end_dat
         raise ValueError("Invalid asset type. Choose from: stocks, indices, forex, crypto.")
     
     try:
-        return yf.download(symbols, start=start_date, end=end_date, group_by="ticker")
+        return yf.download(symbols, start=start_date, end=end_date, group_by="ticker", threads=True,
+                           progress=False)
     except Exception as e:
         print(f"Error fetching data for {asset_type}: {e}")
         return None
 
+def _fetch_asset_class_quote(symbol):
+    """
+    Fetch the latest price for one symbol, using None values on failure.
+    """
+    try:
+        stock = yf.Ticker(symbol)
+        latest_data = stock.history(period="1d")
+        if not latest_data.empty:
+            return {
+                "price": latest_data["Close"].iloc[-1],
+                "timestamp": latest_data.index[-1]
+            }
+        print(f"No real-time data for {symbol}")
+    except Exception as e:
+        print(f"Failed to fetch real-time data for {symbol}: {e}")
+    return {"price": None, "timestamp": None}
+
+@lru_cache(maxsize=1024)
+def _cached_asset_class_quote(symbol, time_bucket):
+    """
+    Memoized _fetch_asset_class_quote, keyed by the QUOTE_TTL-second wall-clock window (time_bucket).
+    """
+    return _fetch_asset_class_quote(symbol)
+
+def _quote_bucket():
+    """
+    Index of the current QUOTE_TTL-second wall-clock window, used to key cached quotes.
+    """
+    return int(time.time() // QUOTE_TTL)
+
+def _get_asset_class_quote(symbol):
+    """
+    Return a copy of the quote fetched in the current QUOTE_TTL-second window, fetching it if there is none.
+    Windows are aligned to the clock, so a quote can be reused for anywhere up to QUOTE_TTL seconds.
+    """
+    return dict(_cached_asset_class_quote(symbol, _quote_bucket()))
+
 def get_realtime_data_for_asset_class(asset_type, symbols):
     """
     Fetch real-time data for a specific asset class (stocks, indices, forex, crypto).
+    Symbols are fetched concurrently, and a quote already fetched within the current
+    QUOTE_TTL-second wall-clock window is reused.
     Returns:
         dict: Real-time prices and timestamps.
     """
-    results = {}
-    for symbol in symbols:
-        try:
-            stock = yf.Ticker(symbol)
-            latest_data = stock.history(period="1d")
-            if not latest_data.empty:
-                results[symbol] = {
-                    "price": latest_data["Close"].iloc[-1],
-                    "timestamp": latest_data.index[-1]
-                }
-            else:
-                print(f"No real-time data for {symbol}")
-                results[symbol] = {"price": None, "timestamp": None}
-        except Exception as e:
-            print(f"Failed to fetch real-time data for {symbol}: {e}")
-            results[symbol] = {"price": None, "timestamp": None}
-    return results
+    symbols = list(symbols)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(zip(symbols, executor.map(_get_asset_class_quote, symbols)))
 
 @memory.cache
 def get_cached_historical_data(asset_type, symbols, start_date, end_date):
@@ -115,3 +155,45 @@ def get_cached_historical_data(asset_type, symbols, start_date, end_date):
     Cached version of get_historical_data_for_asset_class for efficiency.
     """
     return get_historical_data_for_asset_class(asset_type, symbols, start_date, end_date)
+
+@memory.cache
+def _cached_ticker_download(ticker, start_date, end_date):
+    """
+    Disk-cached call to get_historical_data; use get_cached_ticker_data instead.
+    """
+    return get_historical_data(ticker, start_date, end_date)
+
+def _is_closed_range(end_date):
+    """
+    Whether a date range ending at `end_date` lies entirely in the past, so its data can no longer change.
+    """
+    if end_date is None:
+        return False
+    return date.fromisoformat(str(end_date)[:10]) < date.today()
+
+def get_cached_ticker_data(ticker, start_date, end_date):
+    """
+    Cached version of get_historical_data for efficiency.
+    Ranges ending today or later are always downloaded fresh, and empty results
+    (yfinance returns an empty frame instead of raising on failure) are not kept.
+    """
+    if not _is_closed_range(end_date):
+        return get_historical_data(ticker, start_date, end_date)
+
+    cached = _cached_ticker_download.call_and_shelve(ticker, start_date, end_date)
+    data = cached.get()
+    if data is None or data.empty:
+        cached.clear()
+    return data
+
+def extract_close_prices(data):
+    """
+    Select the 'Close' prices from a (ticker, field) MultiIndex DataFrame, one column per ticker.
+    Uses a boolean column mask rather than DataFrame.xs to avoid the generic MultiIndex slicing path.
+    """
+    mask = data.columns.get_level_values(1) == 'Close'
+    if not mask.any():
+        raise KeyError('Close')
+    close_prices = data.iloc[:, mask]
+    close_prices.columns = close_prices.columns.get_level_values(0)
+    return close_prices
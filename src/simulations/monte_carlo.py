@@ -1,5 +1,7 @@
+import hashlib
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from src.calculations.metrics import (
     calculate_sharpe_ratio,
     calculate_var,
@@ -8,53 +10,234 @@ from src.calculations.metrics import (
     calculate_omega_ratio
 )
 
-def monte_carlo_with_metrics(returns, num_simulations=1000, time_horizon=252, initial_portfolio=10000, threshold=0.01):
+# Number of independent random streams (blocks of paths) per simulation; fixed so that seeded
+# results do not depend on n_jobs or on the number of cores
+RNG_STREAMS = 16
+
+# Number of (mean, Cholesky factor) estimates kept by estimate_return_moments
+MOMENTS_CACHE_SIZE = 32
+_MOMENTS_CACHE = {}
+
+def cholesky_factor_with_jitter(cov_matrix, jitter=1e-10, max_attempts=6):
     """
-    Perform Monte Carlo simulations and calculate metrics.
-    Handles covariance matrix failures with fallback to univariate simulations.
+    Compute the Cholesky factor of a covariance matrix, adding a growing multiple of the
+    identity to the diagonal when the matrix is not numerically positive definite.
+
+    Raises:
+        np.linalg.LinAlgError: If the matrix cannot be factored even with the largest jitter.
+    """
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    try:
+        return np.linalg.cholesky(cov_matrix)
+    except np.linalg.LinAlgError:
+        pass
+
+    # Scale the jitter to the matrix so it stays negligible relative to the variances
+    scale = (np.abs(np.diag(cov_matrix)).mean() if cov_matrix.size else 0.0) or 1.0
+    identity = np.eye(cov_matrix.shape[0])
+    for attempt in range(max_attempts):
+        try:
+            return np.linalg.cholesky(cov_matrix + jitter * scale * 10 ** attempt * identity)
+        except np.linalg.LinAlgError:
+            continue
+    raise np.linalg.LinAlgError("Covariance matrix is not positive definite, even with jitter.")
+
+def nearest_psd_covariance(cov_matrix, min_eigenvalue=1e-12):
+    """
+    Project a covariance matrix onto the positive definite matrices by symmetrising it
+    and clipping its eigenvalues from below.
+    """
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    cov_matrix = 0.5 * (cov_matrix + cov_matrix.T)
+    eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
+    eigenvalues = np.clip(eigenvalues, min_eigenvalue, None)
+    return (eigenvectors * eigenvalues) @ eigenvectors.T
+
+def factor_returns_covariance(returns, cov_matrix=None):
     """
-    mean_returns = returns.mean()
-    cov_matrix = returns.cov()
+    Cholesky-factor the covariance of `returns` (or the given cov_matrix), replacing a NaN
+    covariance with the diagonal of variances and repairing matrices that are not PSD.
+    """
+    if cov_matrix is None:
+        cov_matrix = returns.cov()
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
 
     # Handle invalid covariance matrix
-    if np.isnan(cov_matrix.values).any() or cov_matrix.shape[0] == 0:
+    if np.isnan(cov_matrix).any() or cov_matrix.shape[0] == 0:
         print("Covariance matrix invalid. Replacing with diagonal matrix.")
         cov_matrix = np.diag(returns.var())
 
+    try:
+        return cholesky_factor_with_jitter(cov_matrix)
+    except np.linalg.LinAlgError:
+        # Repair the matrix once rather than giving up on the correlation structure
+        print("Covariance matrix not positive definite. Projecting onto the nearest PSD matrix.")
+        return cholesky_factor_with_jitter(nearest_psd_covariance(cov_matrix))
+
+def estimate_return_moments(returns):
+    """
+    Estimate the mean returns and covariance Cholesky factor of `returns`.
+    Results are cached by a hash of the data, so repeated simulations of the same returns
+    skip the estimation; the cached arrays are read-only.
+
+    Returns:
+        tuple: (mean returns, Cholesky factor) as np.ndarrays.
+    """
+    values = np.ascontiguousarray(returns.to_numpy(dtype=np.float64))
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16)
+    digest.update(str(values.shape).encode())
+    key = digest.digest()
+
+    if key not in _MOMENTS_CACHE:
+        if len(_MOMENTS_CACHE) >= MOMENTS_CACHE_SIZE:
+            _MOMENTS_CACHE.pop(next(iter(_MOMENTS_CACHE)))
+        mean_returns = returns.mean().to_numpy(dtype=np.float64)
+        cholesky_factor = factor_returns_covariance(returns)
+        mean_returns.setflags(write=False)
+        cholesky_factor.setflags(write=False)
+        _MOMENTS_CACHE[key] = (mean_returns, cholesky_factor)
+    return _MOMENTS_CACHE[key]
+
+def draw_portfolio_returns(mean_returns, cholesky_factor, time_horizon, num_simulations, rng, dtype=np.float64,
+                           weights=None):
+    """
+    Draw portfolio returns from a factored covariance matrix (equal weights unless `weights` is given).
+    A weighted sum of correlated normal asset returns is itself normal with mean w·mu and
+    standard deviation ||w·L||, so the portfolio return is sampled directly instead of
+    drawing every asset.
+
+    Returns:
+        np.ndarray: Simulated portfolio returns, shape (time_horizon, num_simulations).
+    """
+    if weights is None:
+        weights = np.full(len(mean_returns), 1 / len(mean_returns))
+    weights = np.asarray(weights, dtype=np.float64)
+    portfolio_mean = weights @ mean_returns
+    portfolio_volatility = np.linalg.norm(weights @ cholesky_factor)
+    portfolio_returns = rng.standard_normal((time_horizon, num_simulations), dtype=dtype)
+    portfolio_returns *= portfolio_volatility
+    portfolio_returns += portfolio_mean
+    return portfolio_returns
+
+def compound_portfolio_values(portfolio_returns, initial_portfolio):
+    """
+    Compound simulated returns into portfolio values, reusing a single buffer.
+    """
+    portfolio_values = np.add(portfolio_returns, 1)
+    np.cumprod(portfolio_values, axis=0, out=portfolio_values)
+    portfolio_values *= initial_portfolio
+    return portfolio_values
+
+def _simulate_value_block(mean_returns, cholesky_factor, time_horizon, dtype, weights, initial_portfolio,
+                          num_simulations, rng):
+    """
+    Simulate and compound one block of portfolio value paths.
+    """
+    portfolio_returns = draw_portfolio_returns(mean_returns, cholesky_factor, time_horizon, num_simulations, rng,
+                                               dtype, weights)
+    return compound_portfolio_values(portfolio_returns, initial_portfolio)
+
+def _simulate_metrics_block(mean_returns, cholesky_factor, time_horizon, dtype, weights, initial_portfolio,
+                            threshold, num_simulations, rng):
+    """
+    Simulate one block of paths and calculate the risk metrics of each path.
+
+    Returns:
+        tuple: (dict of metric arrays, portfolio values of shape (time_horizon, num_simulations)).
+    """
+    portfolio_returns = draw_portfolio_returns(mean_returns, cholesky_factor, time_horizon, num_simulations, rng,
+                                               dtype, weights)
+    # Only the sampling runs in `dtype`; compounding and metrics use the reduced returns in float64
+    portfolio_returns = portfolio_returns.astype(np.float64, copy=False)
+    portfolio_values = compound_portfolio_values(portfolio_returns, initial_portfolio)
+
+    value_at_risk = calculate_var(portfolio_returns, confidence_level=0.95)
     metrics = {
-        "Sharpe Ratio": [],
-        "VaR (95%)": [],
-        "CVaR (95%)": [],
-        "Max Drawdown": [],
-        "Omega Ratio": []
+        "Sharpe Ratio": calculate_sharpe_ratio(portfolio_returns),
+        "VaR (95%)": value_at_risk,
+        "CVaR (95%)": calculate_cvar(portfolio_returns, confidence_level=0.95, var=value_at_risk),
+        "Max Drawdown": calculate_max_drawdown(portfolio_values),
+        "Omega Ratio": calculate_omega_ratio(portfolio_returns, threshold=threshold)
     }
+    return metrics, portfolio_values
 
-    portfolio_values = np.zeros((time_horizon, num_simulations))
+def _map_simulation_blocks(block_function, num_simulations, rng, n_jobs, *args, **kwargs):
+    """
+    Split the simulations into RNG_STREAMS blocks, each with its own random stream spawned from `rng`,
+    and run `block_function` on every block, in worker processes when n_jobs allows.
+    The blocks do not depend on n_jobs, so a seeded run gives the same paths on any machine.
 
-    for sim in range(num_simulations):
-        try:
-            # Attempt multivariate simulation
-            daily_returns = np.random.multivariate_normal(mean_returns, cov_matrix, time_horizon)
-        except np.linalg.LinAlgError:
-            # Fallback to univariate simulations if covariance fails
-            print(f"Simulation {sim+1} failed: Covariance invalid, using univariate returns.")
-            daily_returns = np.random.normal(mean_returns.mean(), np.sqrt(returns.var().mean()), time_horizon)
+    Returns:
+        list: One block_function result per block, in simulation order.
+    """
+    block_sizes = [len(block) for block in
+                   np.array_split(np.arange(num_simulations), max(1, min(RNG_STREAMS, num_simulations)))]
+    block_rngs = rng.spawn(len(block_sizes))
 
-        # Convert returns to portfolio values
-        portfolio_returns = pd.Series(daily_returns.mean(axis=1) if daily_returns.ndim > 1 else daily_returns)
-        cumulative_returns = (1 + portfolio_returns).cumprod()
-        portfolio_values[:, sim] = initial_portfolio * cumulative_returns
+    num_workers = min(effective_n_jobs(n_jobs), len(block_sizes))
+    if num_workers <= 1:
+        return [block_function(*args, num_simulations=size, rng=block_rng, **kwargs)
+                for size, block_rng in zip(block_sizes, block_rngs)]
+    return Parallel(n_jobs=num_workers)(
+        delayed(block_function)(*args, num_simulations=size, rng=block_rng, **kwargs)
+        for size, block_rng in zip(block_sizes, block_rngs)
+    )
 
-        # Calculate metrics
-        try:
-            metrics["Sharpe Ratio"].append(calculate_sharpe_ratio(portfolio_returns))
-            metrics["VaR (95%)"].append(calculate_var(portfolio_returns, confidence_level=0.95))
-            metrics["CVaR (95%)"].append(calculate_cvar(portfolio_returns, confidence_level=0.95))
-            metrics["Max Drawdown"].append(calculate_max_drawdown(portfolio_values[:, sim]))
-            metrics["Omega Ratio"].append(calculate_omega_ratio(portfolio_returns, threshold=threshold))
-        except Exception as e:
-            print(f"Metrics calculation failed for Simulation {sim+1}: {e}")
-            continue
+def _prepare_moments(returns, dtype, mean_returns=None, cov_matrix=None, cholesky_factor=None):
+    """
+    Return the mean returns and Cholesky factor in `dtype`, estimating whichever is not given.
+    """
+    if mean_returns is None and cov_matrix is None and cholesky_factor is None:
+        mean_returns, cholesky_factor = estimate_return_moments(returns)
+    else:
+        if mean_returns is None:
+            mean_returns = returns.mean()
+        if cholesky_factor is None:
+            cholesky_factor = factor_returns_covariance(returns, cov_matrix)
+    return np.asarray(mean_returns, dtype=dtype), np.asarray(cholesky_factor, dtype=dtype)
+
+def monte_carlo_simulation(returns, num_simulations=1000, time_horizon=252, initial_portfolio=10000, seed=None,
+                           dtype=np.float64, n_jobs=1, mean_returns=None, cov_matrix=None, cholesky_factor=None,
+                           weights=None):
+    """
+    Simulate portfolio value paths, equally weighted unless asset `weights` are given.
+    The covariance matrix is factored once and the paths are drawn in RNG_STREAMS blocks with
+    independent random streams spawned from `seed`, so seeded results do not depend on n_jobs.
+    Use dtype=np.float32 to halve the memory traffic of large simulations, and n_jobs to draw and
+    compound the blocks in worker processes.
+    The mean and Cholesky factor of `returns` are cached across calls (see estimate_return_moments);
+    precomputed mean_returns, cov_matrix or cholesky_factor can also be passed explicitly.
+
+    Returns:
+        pd.DataFrame: Portfolio values over time, one column per simulation.
+    """
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+    mean_returns, cholesky_factor = _prepare_moments(returns, dtype, mean_returns, cov_matrix, cholesky_factor)
+    blocks = _map_simulation_blocks(_simulate_value_block, num_simulations, rng, n_jobs,
+                                    mean_returns, cholesky_factor, time_horizon, dtype, weights, initial_portfolio)
+    return pd.DataFrame(np.concatenate(blocks, axis=1))
+
+def monte_carlo_with_metrics(returns, num_simulations=1000, time_horizon=252, initial_portfolio=10000, threshold=0.01,
+                             seed=None, dtype=np.float64, n_jobs=1, mean_returns=None, cov_matrix=None,
+                             cholesky_factor=None, weights=None):
+    """
+    Perform Monte Carlo simulations and calculate metrics.
+    Covariance matrices that cannot be factored are projected onto the nearest PSD matrix.
+    Pass `seed` for reproducible simulations, `dtype` to choose the simulation precision and
+    `n_jobs` to simulate and evaluate blocks of paths in several processes. Precomputed mean_returns,
+    cov_matrix or cholesky_factor are reused instead of being estimated from `returns`, and
+    `weights` sets the asset weights of the portfolio (equal weights by default).
+    """
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+    mean_returns, cholesky_factor = _prepare_moments(returns, dtype, mean_returns, cov_matrix, cholesky_factor)
+    blocks = _map_simulation_blocks(_simulate_metrics_block, num_simulations, rng, n_jobs,
+                                    mean_returns, cholesky_factor, time_horizon, dtype, weights,
+                                    initial_portfolio, threshold)
+
+    # Each block returns its metrics and paths; join them in simulation order
+    metrics = {name: np.concatenate([block_metrics[name] for block_metrics, _ in blocks])
+               for name in blocks[0][0]}
+    portfolio_values = np.concatenate([block_values for _, block_values in blocks], axis=1)
 
-    metrics_df = pd.DataFrame(metrics)
+    metrics_df = pd.DataFrame(metrics, dtype=np.float64)
     return metrics_df, pd.DataFrame(portfolio_values)
@@ -1,4 +1,4 @@
-from src.data.fetch_data import get_cached_historical_data
+from src.data.fetch_data import extract_close_prices, get_cached_historical_data
 from src.calculations.metrics import (
     calculate_sharpe_ratio,
     calculate_var,
@@ -6,6 +6,7 @@ from src.calculations.metrics import (
     calculate_max_drawdown,
     calculate_omega_ratio
 )
+import numpy as np
 import pandas as pd
 
 def analyze_real_data_metrics(tickers, start_date, end_date):
@@ -17,23 +18,22 @@ def analyze_real_data_metrics(tickers, start_date, end_date):
     
     # Extract 'Close' prices from MultiIndex DataFrame
     if isinstance(data.columns, pd.MultiIndex):
-        close_prices = data.xs('Close', axis=1, level=1)
+        close_prices = extract_close_prices(data)
     else:
         close_prices = data  # Single ticker scenario
 
     # Calculate returns
+    close_prices = close_prices[list(tickers)]
     returns = close_prices.pct_change().dropna()
 
-    # Calculate metrics for each ticker
-    metrics = {}
-    for ticker in tickers:
-        ticker_returns = returns[ticker]
-        metrics[ticker] = {
-            "Sharpe Ratio": round(calculate_sharpe_ratio(ticker_returns), 2),
-            "VaR (95%)": round(calculate_var(ticker_returns), 4),
-            "CVaR (95%)": round(calculate_cvar(ticker_returns), 4),
-            "Max Drawdown": round(calculate_max_drawdown(close_prices[ticker]), 4),
-            "Omega Ratio": round(calculate_omega_ratio(ticker_returns, threshold=0.01), 2)
-        }
-    
-    return pd.DataFrame(metrics).T
+    # Calculate every metric for all tickers at once (one column per ticker)
+    return_values = returns.to_numpy()
+    metrics = pd.DataFrame({
+        "Sharpe Ratio": np.round(calculate_sharpe_ratio(return_values), 2),
+        "VaR (95%)": np.round(calculate_var(return_values), 4),
+        "CVaR (95%)": np.round(calculate_cvar(return_values), 4),
+        "Max Drawdown": np.round(calculate_max_drawdown(close_prices.to_numpy()), 4),
+        "Omega Ratio": np.round(calculate_omega_ratio(return_values, threshold=0.01), 2)
+    }, index=list(tickers))
+
+    return metrics
@@ -1,4 +1,5 @@
 from src.data.fetch_data import (
+    extract_close_prices,
     get_cached_historical_data,
     get_historical_data_for_asset_class,
     get_realtime_data_for_asset_class,
@@ -6,19 +7,34 @@ from src.data.fetch_data import (
 from src.simulations.monte_carlo import monte_carlo_with_metrics
 from src.visualizations.plot_monte_carlo_with_metrics import plot_monte_carlo_with_metrics
 from src.visualizations.plot_asset_performance import plot_asset_performance
+from functools import lru_cache
 import os
 import pandas as pd
 
+@lru_cache(maxsize=32)
+def _cached_returns(tickers, start_date, end_date):
+    """
+    Fetch historical data once per (tickers, dates) and compute the close prices and daily returns.
+    """
+    data = get_cached_historical_data("stocks", list(tickers), start_date, end_date)
+    close_prices = extract_close_prices(data)
+    returns = close_prices.pct_change().dropna()
+    return close_prices, returns
+
+def _prep_returns(tickers, start_date, end_date):
+    """
+    Return copies of the memoized close prices and daily returns, so callers cannot alter the cache.
+    """
+    close_prices, returns = _cached_returns(tickers, start_date, end_date)
+    return close_prices.copy(), returns.copy()
+
 def run_monte_carlo_with_visualization(tickers, start_date, end_date, num_simulations=1000, time_horizon=252):
     """
     Fetch real-world data, run Monte Carlo simulations, calculate metrics, and visualize results.
     """
     print("Fetching historical data...")
-    data = get_cached_historical_data("stocks", tickers, start_date, end_date)
-
     try:
-        close_prices = data.xs('Close', axis=1, level=1)
-        returns = close_prices.pct_change().dropna()
+        close_prices, returns = _prep_returns(tuple(sorted(tickers)), start_date, end_date)
     except Exception as e:
         print(f"Error processing data: {e}")
         return
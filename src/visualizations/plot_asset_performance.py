@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 import pandas as pd
+from src.data.fetch_data import extract_close_prices
 
 def plot_asset_performance(data, asset_classes, save_path=None):
     """
@@ -16,7 +17,7 @@ def plot_asset_performance(data, asset_classes, save_path=None):
         df = data[asset_class]
         
         # Extract 'Close' prices and normalize them to start at 100
-        close_prices = df.xs('Close', axis=1, level=1).copy()
+        close_prices = extract_close_prices(df)
         normalized_prices = (close_prices / close_prices.iloc[0]) * 100
 
         # Plot each asset's normalized performance
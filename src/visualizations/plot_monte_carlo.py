@@ -1,10 +1,66 @@
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+import matplotlib.dates as mdates
+import numpy as np
 import pandas as pd
 import os
 
+# Maximum number of individual paths drawn; the rest are summarised by the percentile envelope
+MAX_PLOTTED_PATHS = 200
+
+def _path_data(ax, portfolio_values):
+    """
+    Return numeric x values and a 2-D (time steps, simulations) array for the simulated paths.
+    A pandas index is used for x; dates are converted with date2num and the axis is set to show them.
+    A single path (1-D input or Series) becomes one column.
+    """
+    values = np.asarray(portfolio_values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    index = portfolio_values.index if isinstance(portfolio_values, (pd.Series, pd.DataFrame)) else None
+    if index is not None and pd.api.types.is_datetime64_any_dtype(index):
+        ax.xaxis_date()
+        return mdates.date2num(index), values
+    if index is not None and pd.api.types.is_numeric_dtype(index):
+        return np.asarray(index, dtype=float), values
+    return np.arange(len(values), dtype=float), values
+
+def add_path_collection(ax, portfolio_values, max_paths=MAX_PLOTTED_PATHS, **line_kwargs):
+    """
+    Draw simulated paths as a single LineCollection artist instead of one line per column.
+    At most `max_paths` randomly chosen paths are drawn (with a fixed seed, so plots are stable).
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        portfolio_values (pd.DataFrame, pd.Series or np.ndarray): Simulated values, shape
+            (time steps, simulations) or (time steps,) for a single path.
+        max_paths (int): Maximum number of paths to draw (None draws all of them).
+        line_kwargs: Styling passed to LineCollection (colors, alpha, linewidths, ...).
+    """
+    x, values = _path_data(ax, portfolio_values)
+    if max_paths is not None and values.shape[1] > max_paths:
+        columns = np.random.default_rng(0).choice(values.shape[1], size=max_paths, replace=False)
+        values = values[:, np.sort(columns)]
+    # Segments of shape (simulations, time steps, 2)
+    segments = np.stack([np.broadcast_to(x[:, None], values.shape).T, values.T], axis=-1)
+    ax.add_collection(LineCollection(segments, **line_kwargs))
+    ax.autoscale()
+
+def add_percentile_envelope(ax, portfolio_values, color="navy"):
+    """
+    Shade the 5th-95th percentile band of all simulated paths and draw their median.
+    """
+    x, values = _path_data(ax, portfolio_values)
+    p5, p50, p95 = np.percentile(values, [5, 50, 95], axis=1)
+    ax.fill_between(x, p5, p95, color=color, alpha=0.2, label="5th-95th percentile")
+    ax.plot(x, p50, color=color, linewidth=1.5, label="Median")
+    ax.legend(loc="lower left")
+
 def plot_monte_carlo_paths(portfolio_values, save_dir=None, file_name="monte_carlo_simulation.png", show=True):
     """
     Plot Monte Carlo simulated portfolio paths, save the figure, and display it.
+    A random sample of paths is drawn together with the percentile envelope of all of them.
 
     Parameters:
         portfolio_values (pd.DataFrame): Simulated portfolio values over time.
@@ -13,7 +69,8 @@ def plot_monte_carlo_paths(portfolio_values, save_dir=None, file_name="monte_car
         show (bool): Whether to display the plot after saving (default: True).
     """
     plt.figure(figsize=(12, 6))
-    plt.plot(portfolio_values, alpha=0.1, color="blue")
+    add_path_collection(plt.gca(), portfolio_values, alpha=0.1, colors="blue")
+    add_percentile_envelope(plt.gca(), portfolio_values)
     plt.title("Monte Carlo Simulated Portfolio Paths")
     plt.xlabel("Days")
     plt.ylabel("Portfolio Value")
@@ -2,6 +2,7 @@
 
 import matplotlib.pyplot as plt
 import pandas as pd
+from src.visualizations.plot_monte_carlo import add_path_collection, add_percentile_envelope
 
 def plot_monte_carlo_with_metrics(portfolio_values, metrics_df, save_path=None):
     """
@@ -14,8 +15,9 @@ def plot_monte_carlo_with_metrics(portfolio_values, metrics_df, save_path=None):
     """
     plt.figure(figsize=(12, 6))
 
-    # Plot all simulated paths without labels to avoid clutter
-    plt.plot(portfolio_values, alpha=0.1, color="blue", linewidth=0.5)
+    # Plot a sample of simulated paths without labels to avoid clutter, plus the envelope of all paths
+    add_path_collection(plt.gca(), portfolio_values, alpha=0.1, colors="blue", linewidths=0.5)
+    add_percentile_envelope(plt.gca(), portfolio_values)
 
     # Overlay mean metrics summary
     sharpe_ratio = metrics_df["Sharpe Ratio"].mean()
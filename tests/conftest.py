@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+from src.simulations.monte_carlo import monte_carlo_simulation
+
+
+def pytest_configure(config):
+    """
+    Register the marker for tests that talk to Yahoo Finance, so they can be
+    deselected (-m "not network") or run apart from the offline tests.
+    """
+    config.addinivalue_line("markers", "network: test requires access to Yahoo Finance")
+
+
+@pytest.fixture(scope="session")
+def synthetic_returns():
+    """
+    Small two-asset return series shared by the Monte Carlo tests.
+    """
+    return pd.DataFrame({
+        "Asset1": [0.01, 0.02, -0.01, 0.03],
+        "Asset2": [0.02, 0.01, 0.0, -0.02]
+    })
+
+
+@pytest.fixture(scope="session")
+def simulated_paths(synthetic_returns):
+    """
+    Default Monte Carlo simulation of the synthetic returns, run once per session.
+    """
+    return monte_carlo_simulation(synthetic_returns)
@@ -23,10 +23,13 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.calculations import metrics
+
 from src.calculations.metrics import (
     calculate_returns,
     calculate_covariance,
     portfolio_performance,
+    portfolio_performance_batch,
     calculate_sharpe_ratio,
     calculate_omega_ratio,
     calculate_var,               # Ensure these functions are imported
@@ -48,6 +51,15 @@ def calculate_returns(prices):
     returns = np.log(prices / prices.shift(1))
     return returns.dropna()
 
+def test_calculate_returns():
+    """
+    Tests the calculation of log returns for a given price series.
+    """
+    returns = metrics.calculate_returns(prices)
+    expected = np.log(prices / prices.shift(1)).dropna()
+    assert not returns.isnull().values.any(), "Returns contain null values"
+    pd.testing.assert_frame_equal(returns, expected)
+
 def test_calculate_covariance():
     """
     Tests the calculation of the covariance matrix for the asset returns.
@@ -56,6 +68,16 @@ def test_calculate_covariance():
     cov_matrix = calculate_covariance(returns)
     assert cov_matrix.shape == (2, 2), "Covariance matrix calculation failed"
 
+def test_calculate_covariance_posthoc():
+    """
+    Tests that the post-hoc covariance formula matches the centered calculation.
+    """
+    returns = calculate_returns(prices)
+    centered = calculate_covariance(returns)
+    posthoc = calculate_covariance(returns, method="posthoc")
+    assert np.allclose(centered.values, returns.cov().values), "Centered covariance calculation failed"
+    assert np.allclose(centered.values, posthoc.values), "Post-hoc covariance calculation failed"
+
 def test_portfolio_performance():
     """
     Tests the calculation of portfolio performance metrics (expected return and risk).
@@ -67,6 +89,20 @@ def test_portfolio_performance():
     perf = portfolio_performance(weights, mean_returns, cov_matrix)
     assert len(perf) == 2, "Portfolio performance calculation failed"
 
+def test_portfolio_performance_batch():
+    """
+    Tests that batched portfolio performance matches the single-portfolio calculation.
+    """
+    returns = calculate_returns(prices)
+    mean_returns = returns.mean()
+    cov_matrix = calculate_covariance(returns)
+    weights = np.array([[0.5, 0.5], [0.2, 0.8], [1.0, 0.0]])
+    batch_returns, batch_risks = portfolio_performance_batch(weights, mean_returns, cov_matrix)
+    for i, w in enumerate(weights):
+        expected_return, expected_risk = portfolio_performance(w, mean_returns, cov_matrix)
+        assert np.isclose(batch_returns[i], expected_return), "Batched portfolio return calculation failed"
+        assert np.isclose(batch_risks[i], expected_risk), "Batched portfolio risk calculation failed"
+
 def test_calculate_sharpe_ratio():
     """
     Tests the calculation of the Sharpe Ratio.
@@ -77,6 +113,19 @@ def test_calculate_sharpe_ratio():
     sharpe_ratio = calculate_sharpe_ratio(portfolio_return, portfolio_volatility, risk_free_rate)
     assert round(sharpe_ratio, 2) == 0.53, "Sharpe Ratio calculation failed"
 
+def test_calculate_sharpe_ratio_from_returns():
+    """
+    Tests the calculation of the Sharpe Ratio from a series of returns.
+    """
+    returns = pd.Series([0.05, 0.07, 0.03, -0.02, 0.04])
+    sharpe_ratio = calculate_sharpe_ratio(returns, risk_free_rate=0.01)
+    expected = (returns.mean() - 0.01) / returns.std()
+    assert np.isclose(sharpe_ratio, expected), "Sharpe Ratio calculation from returns failed"
+    assert np.isclose(calculate_sharpe_ratio(returns.values, risk_free_rate=0.01), expected), \
+        "Sharpe Ratio calculation from array returns failed"
+    batched = calculate_sharpe_ratio(np.column_stack([returns.values, np.zeros(5)]), risk_free_rate=0.01)
+    assert np.allclose(batched, [expected, 0.0]), "Batched Sharpe Ratio calculation failed"
+
 def test_calculate_omega_ratio():
     """
     Tests the calculation of the Omega Ratio.
@@ -86,6 +135,15 @@ def test_calculate_omega_ratio():
     omega_ratio = calculate_omega_ratio(returns, threshold)
     assert round(omega_ratio, 2) == 2.75, "Omega Ratio calculation failed"
 
+def test_calculate_omega_ratio_multiple_series():
+    """
+    Tests that the Omega Ratio is calculated per column, including series without losses.
+    """
+    returns = np.array([[0.05, 0.03], [0.07, 0.04], [0.03, 0.05], [-0.02, 0.06], [0.04, 0.03]])
+    omega_ratio = calculate_omega_ratio(returns, threshold=0.02)
+    assert round(omega_ratio[0], 2) == 2.75, "Batched Omega Ratio calculation failed"
+    assert np.isinf(omega_ratio[1]), "Omega Ratio without losses should be infinite"
+
 def test_calculate_var():
     """
     Tests the calculation of Value at Risk (VaR).
@@ -102,6 +160,18 @@ def test_calculate_cvar():
     cvar = calculate_cvar(returns, confidence_level=0.95)
     assert round(cvar, 2) == -0.02, "CVaR calculation failed"
 
+def test_calculate_var_cvar_multiple_series():
+    """
+    Tests that VaR and CVaR are calculated per column for a 2-D array of returns.
+    """
+    returns = np.array([[-0.02, -0.05], [-0.01, 0.01], [0.0, 0.02], [0.01, -0.03], [0.03, 0.04]])
+    var = calculate_var(returns, confidence_level=0.95)
+    cvar = calculate_cvar(returns, confidence_level=0.95)
+    assert np.allclose(var, [calculate_var(returns[:, 0]), calculate_var(returns[:, 1])]), "Batched VaR calculation failed"
+    assert np.allclose(cvar, [calculate_cvar(pd.Series(returns[:, 0])), calculate_cvar(pd.Series(returns[:, 1]))]), \
+        "Batched CVaR calculation failed"
+    assert np.allclose(calculate_cvar(returns, var=var), cvar), "CVaR with precomputed VaR failed"
+
 def test_calculate_max_drawdown():
     """
     Tests the calculation of Maximum Drawdown (MDD).
@@ -109,3 +179,11 @@ def test_calculate_max_drawdown():
     portfolio_values = pd.Series([100, 105, 90, 95, 110])
     max_drawdown = calculate_max_drawdown(portfolio_values)
     assert round(max_drawdown, 2) == -0.14, "Maximum Drawdown calculation failed"
+
+def test_calculate_max_drawdown_multiple_paths():
+    """
+    Tests that Maximum Drawdown is calculated per column for a 2-D array of paths.
+    """
+    portfolio_values = np.array([[100, 100], [105, 90], [90, 95], [95, 80], [110, 100]])
+    max_drawdown = calculate_max_drawdown(portfolio_values)
+    assert np.allclose(max_drawdown, [-0.142857, -0.2]), "Maximum Drawdown calculation failed for multiple paths"
@@ -0,0 +1,81 @@
+"""
+This module tests the caching logic in fetch_data.py without network access.
+"""
+
+from joblib import Memory
+import pandas as pd
+from src.data import fetch_data
+
+
+def test_cached_ticker_data_skips_empty_results(monkeypatch, tmp_path):
+    """
+    Test that an empty download (failed request) is not kept in the disk cache.
+    """
+    # Use a throwaway cache so the test never touches ./data_cache
+    monkeypatch.setattr(fetch_data, "_cached_ticker_download",
+                        Memory(tmp_path, verbose=0).cache(fetch_data._cached_ticker_download.func))
+    calls = []
+
+    def fake_download(ticker, start_date, end_date):
+        calls.append(ticker)
+        return pd.DataFrame()
+
+    monkeypatch.setattr(fetch_data, "get_historical_data", fake_download)
+    for _ in range(2):
+        data = fetch_data.get_cached_ticker_data("EMPTY-TEST", "2001-01-01", "2001-01-31")
+        assert data.empty, "Fake download should return an empty frame"
+    assert len(calls) == 2, "Empty result should be downloaded again instead of served from the cache"
+
+
+def test_cached_ticker_data_skips_open_ranges(monkeypatch):
+    """
+    Test that ranges ending today or later bypass the cache.
+    """
+    calls = []
+
+    def fake_download(ticker, start_date, end_date):
+        calls.append(ticker)
+        return pd.DataFrame({"Close": [1.0]})
+
+    monkeypatch.setattr(fetch_data, "get_historical_data", fake_download)
+    monkeypatch.setattr(fetch_data, "_cached_ticker_download", None)
+    for _ in range(2):
+        fetch_data.get_cached_ticker_data("OPEN-TEST", "2001-01-01", "2999-12-31")
+    assert len(calls) == 2, "Open-ended range should always be downloaded fresh"
+
+
+def test_batch_realtime_data_accepts_generators(monkeypatch):
+    """
+    Test that a one-shot iterator of tickers still yields a quote for every ticker.
+    """
+    monkeypatch.setattr(fetch_data, "get_realtime_data", lambda ticker: {"price": 1.0, "timestamp": None})
+    quotes = fetch_data.get_batch_realtime_data(ticker for ticker in ["AAPL", "MSFT"])
+    assert list(quotes) == ["AAPL", "MSFT"], "Generator input should return a quote per ticker"
+
+
+def test_asset_class_quote_reuse(monkeypatch):
+    """
+    Test that quotes are reused within a time bucket, refetched in the next one, and returned as copies.
+    """
+    calls = []
+
+    def fake_quote(symbol):
+        calls.append(symbol)
+        return {"price": 100.0 + len(calls), "timestamp": None}
+
+    bucket = [1000]
+    monkeypatch.setattr(fetch_data, "_fetch_asset_class_quote", fake_quote)
+    monkeypatch.setattr(fetch_data, "_quote_bucket", lambda: bucket[0])
+    fetch_data._cached_asset_class_quote.cache_clear()
+
+    first = fetch_data.get_realtime_data_for_asset_class("stocks", ["AAPL"])
+    first["AAPL"]["price"] = None
+    second = fetch_data.get_realtime_data_for_asset_class("stocks", ["AAPL"])
+    assert len(calls) == 1, "Quote should be reused within the same time bucket"
+    assert second["AAPL"]["price"] == 101.0, "Cached quote should not be changed by callers editing their copy"
+
+    bucket[0] += 1
+    third = fetch_data.get_realtime_data_for_asset_class("stocks", ["AAPL"])
+    assert len(calls) == 2, "Quote should be refetched once the time bucket changes"
+    assert third["AAPL"]["price"] == 102.0, "Refetched quote should be returned"
+    fetch_data._cached_asset_class_quote.cache_clear()
@@ -10,7 +10,12 @@ from src.data.fetch_data import (
     get_historical_data_for_asset_class,  
     get_realtime_data_for_asset_class,   
     get_cached_historical_data,
+    get_cached_ticker_data,
 )
+import pytest
+
+# Every test in this module hits Yahoo Finance
+pytestmark = pytest.mark.network
 
 def test_get_historical_data():
     """
@@ -84,4 +89,12 @@ def test_cached_historical_data():
     data = get_cached_historical_data("stocks", ["AAPL", "MSFT"], "2022-01-01", "2022-12-31")
     assert not data.empty, "Failed to fetch cached historical data"
     assert ("AAPL", "Close") in data.columns, "Cached data missing 'Close' column for AAPL"
-    assert ("MSFT", "Close") in data.columns, "Cached data missing 'Close' column for MSFT"
\ No newline at end of file
+    assert ("MSFT", "Close") in data.columns, "Cached data missing 'Close' column for MSFT"
+
+def test_cached_ticker_data():
+    """
+    Test fetching cached historical data for a single stock.
+    """
+    data = get_cached_ticker_data("AAPL", "2022-01-01", "2022-12-31")
+    assert not data.empty, "Failed to fetch cached ticker data"
+    assert "Close" in data.columns, "Cached ticker data missing expected 'Close' column"
@@ -1,14 +1,87 @@
-from src.simulations.monte_carlo import monte_carlo_simulation
+from src.simulations.monte_carlo import (
+    monte_carlo_simulation,
+    cholesky_factor_with_jitter,
+    estimate_return_moments,
+)
+import numpy as np
 import pandas as pd
 
-def test_monte_carlo_simulation():
+def test_monte_carlo_simulation(simulated_paths):
     """
     Test Monte Carlo simulation with synthetic returns.
     """
-    data = pd.DataFrame({
-        "Asset1": [0.01, 0.02, -0.01, 0.03],
-        "Asset2": [0.02, 0.01, 0.0, -0.02]
-    })
-    simulations = monte_carlo_simulation(data)
+    simulations = simulated_paths
     assert simulations.shape[0] > 0, "Simulation failed to generate portfolio paths"
     assert simulations.shape[1] == 1000, "Incorrect number of simulations"
+
+def test_monte_carlo_simulation_float32(synthetic_returns):
+    """
+    Test Monte Carlo simulation in single precision.
+    """
+    simulations = monte_carlo_simulation(synthetic_returns, num_simulations=100, time_horizon=20,
+                                         dtype=np.float32)
+    assert simulations.shape == (20, 100), "Simulation returned incorrect shape"
+    assert (simulations.dtypes == np.float32).all(), "Simulation did not run in single precision"
+
+def test_monte_carlo_simulation_precomputed_inputs(synthetic_returns):
+    """
+    Test that precomputed mean, covariance and Cholesky factor reproduce the default simulation.
+    """
+    expected = monte_carlo_simulation(synthetic_returns, num_simulations=50, time_horizon=20, seed=3)
+    from_cov = monte_carlo_simulation(synthetic_returns, num_simulations=50, time_horizon=20, seed=3,
+                                      mean_returns=synthetic_returns.mean(), cov_matrix=synthetic_returns.cov())
+    from_cholesky = monte_carlo_simulation(synthetic_returns, num_simulations=50, time_horizon=20, seed=3,
+                                           mean_returns=synthetic_returns.mean(),
+                                           cholesky_factor=np.linalg.cholesky(synthetic_returns.cov().values))
+    pd.testing.assert_frame_equal(expected, from_cov)
+    pd.testing.assert_frame_equal(expected, from_cholesky)
+
+def test_cholesky_factor_with_jitter():
+    """
+    Test that a singular (positive semi-definite) covariance matrix is factored with jitter.
+    """
+    cov_matrix = np.array([[1e-4, 1e-4], [1e-4, 1e-4]])
+    factor = cholesky_factor_with_jitter(cov_matrix)
+    assert np.allclose(factor @ factor.T, cov_matrix, atol=1e-8), "Jittered factor should reproduce the matrix"
+
+def test_monte_carlo_simulation_indefinite_covariance(synthetic_returns):
+    """
+    Test that an indefinite covariance matrix is repaired instead of aborting the simulation.
+    """
+    cov_matrix = np.array([[1e-4, 2e-4], [2e-4, 1e-4]])
+    result = monte_carlo_simulation(synthetic_returns, num_simulations=20, time_horizon=10, seed=1,
+                                    cov_matrix=cov_matrix)
+    assert np.isfinite(result.values).all(), "Simulation with a repaired covariance should be finite"
+
+def test_estimate_return_moments_cached(synthetic_returns):
+    """
+    Test that moments of identical returns are estimated once and reused.
+    """
+    mean_returns, cholesky_factor = estimate_return_moments(synthetic_returns)
+    repeated_mean, repeated_factor = estimate_return_moments(synthetic_returns.copy())
+    assert repeated_mean is mean_returns, "Mean returns were not reused for identical data"
+    assert repeated_factor is cholesky_factor, "Cholesky factor was not reused for identical data"
+    assert np.allclose(cholesky_factor @ cholesky_factor.T, synthetic_returns.cov().values), \
+        "Cached Cholesky factor does not reproduce the covariance"
+
+def test_monte_carlo_simulation_weights(synthetic_returns):
+    """
+    Test that unequal asset weights set the mean and volatility of the simulated portfolio returns.
+    """
+    weights = np.array([0.8, 0.2])
+    simulations = monte_carlo_simulation(synthetic_returns, num_simulations=20000, time_horizon=20, seed=5,
+                                         initial_portfolio=1, weights=weights)
+    daily_returns = simulations.pct_change().iloc[1:].values
+    expected_mean = weights @ synthetic_returns.mean().values
+    expected_volatility = np.sqrt(weights @ synthetic_returns.cov().values @ weights)
+    assert np.isclose(daily_returns.mean(), expected_mean, atol=2e-4), "Weighted portfolio mean is incorrect"
+    assert np.isclose(daily_returns.std(), expected_volatility, rtol=0.02), "Weighted portfolio volatility is incorrect"
+    assert not np.isclose(expected_mean, synthetic_returns.mean().mean()), "Weights should differ from equal weights"
+
+def test_monte_carlo_simulation_independent_of_n_jobs(synthetic_returns):
+    """
+    Test that a seeded simulation gives the same paths however many workers are used.
+    """
+    serial = monte_carlo_simulation(synthetic_returns, num_simulations=101, time_horizon=20, seed=7)
+    parallel = monte_carlo_simulation(synthetic_returns, num_simulations=101, time_horizon=20, seed=7, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
@@ -1,15 +1,11 @@
 from src.simulations.monte_carlo import monte_carlo_with_metrics
 import pandas as pd
 
-def test_monte_carlo_with_metrics():
+def test_monte_carlo_with_metrics(synthetic_returns):
     """
     Test Monte Carlo simulation with integrated metrics.
     """
-    data = pd.DataFrame({
-        "Asset1": [0.01, 0.02, -0.01, 0.03],
-        "Asset2": [0.02, 0.01, 0.0, -0.02]
-    })
-    metrics = monte_carlo_with_metrics(data, num_simulations=10, time_horizon=10)
+    metrics, portfolio_values = monte_carlo_with_metrics(synthetic_returns, num_simulations=10, time_horizon=10)
 
     assert not metrics.empty, "Metrics DataFrame is empty"
     assert "Sharpe Ratio" in metrics.columns, "Sharpe Ratio missing from results"
@@ -17,3 +13,37 @@ def test_monte_carlo_with_metrics():
     assert "CVaR (95%)" in metrics.columns, "CVaR missing from results"
     assert "Max Drawdown" in metrics.columns, "Max Drawdown missing from results"
     assert "Omega Ratio" in metrics.columns, "Omega Ratio missing from results"
+    assert portfolio_values.shape == (10, 10), "Portfolio values returned incorrect shape"
+
+def test_monte_carlo_with_metrics_seed(synthetic_returns):
+    """
+    Test that seeded Monte Carlo simulations are reproducible.
+    """
+    metrics_a, values_a = monte_carlo_with_metrics(synthetic_returns, num_simulations=10, time_horizon=10,
+                                                   seed=42)
+    metrics_b, values_b = monte_carlo_with_metrics(synthetic_returns, num_simulations=10, time_horizon=10,
+                                                   seed=42)
+
+    pd.testing.assert_frame_equal(metrics_a, metrics_b)
+    pd.testing.assert_frame_equal(values_a, values_b)
+
+def test_monte_carlo_with_metrics_float32(synthetic_returns):
+    """
+    Test that single-precision sampling still reports metrics and values in float64.
+    """
+    metrics, values = monte_carlo_with_metrics(synthetic_returns, num_simulations=10, time_horizon=10, seed=42,
+                                               dtype="float32")
+
+    assert (metrics.dtypes == "float64").all(), "Metrics should be computed in float64"
+    assert (values.dtypes == "float64").all(), "Portfolio values should be compounded in float64"
+
+def test_monte_carlo_with_metrics_parallel(synthetic_returns):
+    """
+    Test that metrics computed in worker processes match the serial run.
+    """
+    metrics, values = monte_carlo_with_metrics(synthetic_returns, num_simulations=50, time_horizon=10, seed=42)
+    parallel_metrics, parallel_values = monte_carlo_with_metrics(synthetic_returns, num_simulations=50,
+                                                                 time_horizon=10, seed=42, n_jobs=2)
+
+    pd.testing.assert_frame_equal(metrics, parallel_metrics)
+    pd.testing.assert_frame_equal(values, parallel_values)